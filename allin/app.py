@@ -1,18 +1,17 @@
 import asyncio
-import traceback
-from functools import partialmethod
-from typing import Awaitable, Callable, Literal, Optional, TypeVar, Union
+import logging
+from typing import Any, Awaitable, Callable, Literal, Optional, Sequence, TypeVar, Union
 
 from asgi_typing import ASGIReceiveCallable, ASGISendCallable, HTTPScope, Scope
 from typing_extensions import Concatenate, ParamSpec, TypeAlias
 
-from .context import app_context, request_context
+from .context import _app_ctx, _request_ctx
 from .errors import AllinError, HTTPError, LostConnection
-from .handlers import DEFAULT_ERROR_HANDLERS
-from .parser import parse_headers
+from .handlers import DEFAULT_ERROR_HANDLERS, _render_http_error, http_error_handler
+from .parser import _parse_content_length, find_raw_header
 from .request import Request
-from .response import Response
-from .routing import MatchingCode, Router
+from .response import JSONResponse, Response
+from .routing import Endpoint, MatchingCode, Router
 from .status import status_codes
 from .stream import BodyStream
 
@@ -26,6 +25,64 @@ ERROR_HANDLER_TYPE: TypeAlias = Callable[
     [Exception, Optional[Request]], Awaitable[Response]
 ]
 
+logger = logging.getLogger("allin")
+
+
+def _prerender_http_error(code: status_codes) -> JSONResponse:
+    exc = HTTPError(code)
+    return JSONResponse.from_bytes(
+        _render_http_error(exc), status_code=exc.code, headers=exc.headers
+    )
+
+
+# The responses of unmatched requests are always the same (unless a custom `HTTPError` handler is registered),
+# so they are rendered once, as `http_error_handler` would do.
+_MATCHING_ERRORS = {
+    MatchingCode.NOT_FOUND: (
+        status_codes.NOT_FOUND,
+        _prerender_http_error(status_codes.NOT_FOUND),
+    ),
+    MatchingCode.UNSUPPORTED_METHODS: (
+        status_codes.METHOD_NOT_ALLOWED,
+        _prerender_http_error(status_codes.METHOD_NOT_ALLOWED),
+    ),
+}
+
+# Shared body stream for requests without a body.
+_EMPTY_STREAM = BodyStream.empty()
+
+# ASGI Lifespan events mapped to `(complete message type, failed message type, should exit)`.
+_LIFESPAN_EVENTS = {
+    "lifespan.startup": (
+        "lifespan.startup.complete",
+        "lifespan.startup.failed",
+        False,
+    ),
+    "lifespan.shutdown": (
+        "lifespan.shutdown.complete",
+        "lifespan.shutdown.failed",
+        True,
+    ),
+}
+
+
+class _DisconnectAwareReceive:
+    """
+    Wrap the original ASGI 'receive' function, to prevent if the client to server connection is lost.
+    It will raise a `LostConnection` exception that will be handled by `Allin._handle_http`.
+    """
+
+    __slots__ = ("_receive",)
+
+    def __init__(self, receive: ASGIReceiveCallable) -> None:
+        self._receive = receive
+
+    async def __call__(self):
+        message = await self._receive()
+        if message["type"] == "http.disconnect":
+            raise LostConnection()
+        return message
+
 
 class Allin:
     """
@@ -37,10 +94,17 @@ class Allin:
     def __init__(self) -> None:
         self.startup_handlers: list[EVENT_HANDLER_FUNC_TYPE] = []
         self.shutdown_handlers: list[EVENT_HANDLER_FUNC_TYPE] = []
+        # Snapshots of the event handlers, taken when the lifespan event is dispatched.
+        self._startup_frozen: Optional[tuple[EVENT_HANDLER_FUNC_TYPE, ...]] = None
+        self._shutdown_frozen: Optional[tuple[EVENT_HANDLER_FUNC_TYPE, ...]] = None
         self.router = self.ROUTER_CLASS()
+        # Each application gets its own copy, so `add_error_handler` doesn't leak into other applications.
         self.error_handlers: dict[
             Union[status_codes, type[Exception]], ERROR_HANDLER_TYPE
-        ] = DEFAULT_ERROR_HANDLERS
+        ] = dict(DEFAULT_ERROR_HANDLERS)
+        # Bound methods used on every request, so they aren't looked up (and bound) again per call.
+        self._find_route = self.router.find
+        self._get_error_handler = self.error_handlers.get
 
     def add_event_handler(
         self, event: Literal["startup", "shutdown"], handler: EVENT_HANDLER_FUNC_TYPE
@@ -50,8 +114,10 @@ class Allin:
 
         if event == "startup":
             self.startup_handlers.append(handler)
+            self._startup_frozen = None
         elif event == "shutdown":
             self.shutdown_handlers.append(handler)
+            self._shutdown_frozen = None
         else:
             raise TypeError(f"Unknown event type: {event}")
 
@@ -82,49 +148,74 @@ class Allin:
         See: https://asgi.readthedocs.io/en/latest/specs/lifespan.html#lifespan-protocol
         """
         while True:
-            should_exit = False
             message = await receive()
             event = message["type"]
-            if event == "lifespan.startup":
-                handlers = self.startup_handlers
-            elif event == "lifespan.shutdown":
-                handlers = self.shutdown_handlers
-                should_exit = True
-            else:
+            lifespan_event = _LIFESPAN_EVENTS.get(event)
+            if lifespan_event is None:
                 raise ValueError(f"Unknown lifespan event: {event}")
 
+            complete_type, failed_type, should_exit = lifespan_event
+            if should_exit:
+                if self._shutdown_frozen is None:
+                    self._shutdown_frozen = tuple(self.shutdown_handlers)
+                handlers = self._shutdown_frozen
+            else:
+                if self._startup_frozen is None:
+                    self._startup_frozen = tuple(self.startup_handlers)
+                handlers = self._startup_frozen
+
             try:
                 for func in handlers:
                     await func()
             except Exception:
-                await send({"type": f"{event}.failed"})
-                traceback.print_exc()
+                await send({"type": failed_type})
+                logger.exception("Error in the %r event handler", event)
                 raise
             else:
-                await send({"type": f"{event}.complete"})
+                await send({"type": complete_type})
 
             if should_exit:
                 break
 
     # HTTP Methods decorators
-    def route(self, path: str, *, methods: list[str] = ["get", "head"]):  # noqa: B006
+    def route(self, path: str, *, methods: Sequence[str] = ("get", "head")):
         """A helper for adding routes using the 'decorator' style.
 
         Args:
             path: End point route. (e.g. `/some/path`)
 
         Keyword Arguments:
-            methods: HTTP methods (default: `["get", "head"]`)
+            methods: HTTP methods (default: `("get", "head")`)
         """
         return self.router.route(path, methods=methods)
 
-    get = partialmethod(route, methods=["get"])
-    head = partialmethod(route, methods=["head"])
-    post = partialmethod(route, methods=["post"])
-    put = partialmethod(route, methods=["put"])
-    delete = partialmethod(route, methods=["delete"])
-    patch = partialmethod(route, methods=["patch"])
-    options = partialmethod(route, methods=["options"])
+    def get(self, path: str):
+        """A shortcut for `route(path, methods=("get",))`."""
+        return self.router.route(path, methods=("get",))
+
+    def head(self, path: str):
+        """A shortcut for `route(path, methods=("head",))`."""
+        return self.router.route(path, methods=("head",))
+
+    def post(self, path: str):
+        """A shortcut for `route(path, methods=("post",))`."""
+        return self.router.route(path, methods=("post",))
+
+    def put(self, path: str):
+        """A shortcut for `route(path, methods=("put",))`."""
+        return self.router.route(path, methods=("put",))
+
+    def delete(self, path: str):
+        """A shortcut for `route(path, methods=("delete",))`."""
+        return self.router.route(path, methods=("delete",))
+
+    def patch(self, path: str):
+        """A shortcut for `route(path, methods=("patch",))`."""
+        return self.router.route(path, methods=("patch",))
+
+    def options(self, path: str):
+        """A shortcut for `route(path, methods=("options",))`."""
+        return self.router.route(path, methods=("options",))
 
     def include_router(self, router: Router):
         """Adding another router to the main router.
@@ -140,8 +231,7 @@ class Allin:
         func: ERROR_HANDLER_TYPE,
         force: bool = False,
     ):
-        handler = self._find_error_handler(code_or_exception)
-        if handler and not force:
+        if code_or_exception in self.error_handlers and not force:
             raise AllinError(f"Error handler for {code_or_exception!r} already exists")
 
         assert not isinstance(code_or_exception, int) and isinstance(
@@ -157,20 +247,88 @@ class Allin:
         Args:
             code_or_exception: HTTP status code or exceptions
         """
-        handler = None
         if isinstance(code_or_exception, int):
-            handler = self.error_handlers.get(code_or_exception)
-            return handler
+            return self._get_error_handler(code_or_exception)
 
         if not isinstance(code_or_exception, type):
             code_or_exception = type(code_or_exception)
 
-        for ce, func in self.error_handlers.items():
-            klass = code_or_exception.mro()[0]
-            if ce == klass:
-                handler = func
-                break
-        return handler
+        # Walk the MRO so a handler for a base class also handles its subclasses.
+        for klass in code_or_exception.__mro__:
+            handler = self._get_error_handler(klass)
+            if handler:
+                return handler
+        return None
+
+    def _create_stream(
+        self, scope: HTTPScope, receive: ASGIReceiveCallable, message: dict
+    ) -> BodyStream:
+        """Create the stream of the HTTP request body.
+
+        Args:
+            scope: ASGI HTTP scope
+            receive: ASGI 'receive' function
+            message: The first 'http.request' message
+        """
+        body = message["body"]
+        if message["more_body"]:
+            # Only the 'content-length' header is needed here,
+            # the request headers are parsed when the endpoint accesses them.
+            content_length = _parse_content_length(
+                find_raw_header(scope["headers"], b"content-length")
+            )
+            return BodyStream(receive, body, content_length)
+
+        if body:
+            return BodyStream.from_complete(body)
+
+        # Most requests (e.g. GET, HEAD) have no body at all.
+        return _EMPTY_STREAM
+
+    async def _call_endpoint(
+        self,
+        request: Request,
+        endpoint: Endpoint,
+        path_params: dict[str, Any],
+        send: ASGISendCallable,
+    ) -> None:
+        """Call the endpoint with the request bound to the current context, and send its response.
+
+        Args:
+            request: Request object
+            endpoint: Matched endpoint
+            path_params: Path parameters of the endpoint
+            send: ASGI 'send' function
+        """
+        # Bind the request to the current context directly, any task spawned by the endpoint
+        # inherits it from the context copy made by `asyncio.create_task`.
+        token = _request_ctx.set(request)
+        try:
+            response = await endpoint(**path_params)
+            if isinstance(response, Response):
+                await response(send=send)
+            else:
+                raise AllinError(
+                    f"Function {endpoint.func} doesn't return a response object"
+                )
+        finally:
+            _request_ctx.reset(token)
+
+    async def _send_matching_error(
+        self, matching_code: MatchingCode, send: ASGISendCallable
+    ) -> None:
+        """Respond to a request that doesn't match any endpoint, or any method of the endpoint.
+
+        Args:
+            matching_code: `MatchingCode.NOT_FOUND` or `MatchingCode.UNSUPPORTED_METHODS`
+            send: ASGI 'send' function
+        """
+        code, response = _MATCHING_ERRORS[matching_code]
+        if self._get_error_handler(HTTPError) is not http_error_handler:
+            # A custom handler for `HTTPError` has been registered, let it build the response.
+            raise HTTPError(code)
+
+        await response(send=send)
 
     async def _handle_http(
         self, scope: HTTPScope, receive: ASGIReceiveCallable, send: ASGISendCallable
@@ -189,51 +347,28 @@ class Allin:
                 path = scope["path"]
                 method = scope["method"]
                 # Search for matching endpoints in Router.
-                matching_code, endpoint, path_params = self.router.find(path, method)
+                matching_code, endpoint, path_params = self._find_route(path, method)
                 if matching_code == MatchingCode.FOUND:
-                    headers = parse_headers(scope["headers"])
-                    body = message["body"]
-                    more_body = message["more_body"]
-                    content_length = (
-                        len(body) if not more_body else headers.content_length
-                    )
-                    stream = BodyStream(
-                        receive=receive,
-                        initial_buffer=body,
-                        content_length=content_length,
-                    )
-                    request = Request(stream, scope, headers=headers)
-                    with request_context(request):
-                        response = await endpoint(**path_params)
-                        if isinstance(response, Response):
-                            await response(send=send)
-                        else:
-                            raise AllinError(
-                                f"Function {endpoint.func} doesn't return a response object"
-                            )
-                elif matching_code == MatchingCode.NOT_FOUND:
-                    raise HTTPError(status_codes.NOT_FOUND)
-                elif matching_code == MatchingCode.UNSUPPORTED_METHODS:
-                    raise HTTPError(status_codes.METHOD_NOT_ALLOWED)
+                    stream = self._create_stream(scope, receive, message)
+                    request = Request(stream, scope)
+                    await self._call_endpoint(request, endpoint, path_params, send)
+                else:
+                    await self._send_matching_error(matching_code, send)
 
         except LostConnection:
             # Just ignore it, if client connection is lost.
             pass
 
         except Exception as e:
-            identifier = type(e)
-            show_traceback = False
-            handler = self._find_error_handler(identifier)
-            if not handler:
-                # If the handling function is not found for a particular exception.
-                # Use the built in function to handle it and display the error traceback.
-                handler = self._find_error_handler(Exception)
-                show_traceback = True
+            handler = self._find_error_handler(type(e))
+            # If there is no specific handler for the exception, it falls back to the one for `Exception`.
+            # In that case, also display the error traceback.
+            show_traceback = handler is self._get_error_handler(Exception)
 
             response = await handler(e, request)
             await response(send=send)
             if show_traceback:
-                traceback.print_exc()
+                logger.exception("Unhandled error", exc_info=e)
 
     async def __call__(
         self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
@@ -247,19 +382,14 @@ class Allin:
             "websocket",
             "lifespan",
         ), f"Unknown event {event_type!r}"
-        with app_context(self):
+        token = _app_ctx.set(self)
+        try:
             if event_type == "lifespan":
                 await self._handle_lifespan(receive, send)
 
-            async def _receive():
-                # wrap original ASGI 'receive' function, to prevent if the client to server connection is lost.
-                # This function will raise a LostConnection exception that will be handled by self._handle_http.
-                message = await receive()
-                if message["type"] == "http.disconnect":
-                    raise LostConnection()
-                return message
-
             if event_type == "http":
-                await self._handle_http(scope, _receive, send)
+                await self._handle_http(scope, _DisconnectAwareReceive(receive), send)
 
             # todo: websocket support
+        finally:
+            _app_ctx.reset(token)
@@ -1,24 +1,47 @@
 import typing
-from contextlib import contextmanager
-from contextvars import ContextVar
-
-if typing.TYPE_CHECKING:
-    from .app import Allin
-    from .request import Request
+from contextvars import ContextVar, Token
 
 _app_ctx = ContextVar("_app_ctx")
 _request_ctx = ContextVar("_request_ctx")
 
 
-@contextmanager
-def app_context(app: "Allin") -> typing.Iterator[None]:
-    token = _app_ctx.set(app)
-    yield
-    _app_ctx.reset(token)
+class _ContextVarBinding:
+    """
+    Context manager that binds a value to a `ContextVar` and restores the previous value on exit.
+    It's a plain class rather than a `@contextmanager` generator, because it is entered on every request.
+    """
+
+    __slots__ = ("_value", "_token")
+    _var: ContextVar
+
+    def __init__(self, value: typing.Any) -> None:
+        self._value = value
+        self._token: typing.Optional[Token] = None
+
+    def __enter__(self) -> None:
+        self._token = self._var.set(self._value)
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self._var.reset(self._token)
+
+
+class _AppContext(_ContextVarBinding):
+    """
+    Bind the `Allin` application to the current context.
+    """
+
+    __slots__ = ()
+    _var = _app_ctx
+
+
+class _RequestContext(_ContextVarBinding):
+    """
+    Bind the `Request` object to the current context.
+    """
+
+    __slots__ = ()
+    _var = _request_ctx
 
 
-@contextmanager
-def request_context(request: "Request") -> typing.Iterator[None]:
-    token = _request_ctx.set(request)
-    yield
-    _request_ctx.reset(token)
+app_context = _AppContext
+request_context = _RequestContext
@@ -1,15 +1,38 @@
 from typing import Optional
 
-from msgspec import ValidationError
+from msgspec import ValidationError, json
 
 from .errors import HTTPError
 from .request import Request
 from .response import JSONResponse
 from .status import status_codes
 
+# JSON bodies of the `HTTPError`s with the default detail (and no extra fields), keyed by the status code.
+_DEFAULT_ERROR_BODIES: dict[status_codes, bytes] = {}
+
+
+def _render_http_error(exc: HTTPError) -> bytes:
+    """
+    Serialize `exc.to_json()`. The body of an error with the default detail is serialized only once per status code,
+    unless `to_json` is overridden.
+    """
+    if (
+        exc.detail is not exc.code.phrase
+        or exc.fields
+        or type(exc).to_json is not HTTPError.to_json
+    ):
+        return json.encode(exc.to_json())
+
+    body = _DEFAULT_ERROR_BODIES.get(exc.code)
+    if body is None:
+        body = _DEFAULT_ERROR_BODIES[exc.code] = json.encode(exc.to_json())
+    return body
+
 
 async def http_error_handler(exc: HTTPError, request: Optional[Request] = None):
-    return JSONResponse(exc.to_json(), status_code=exc.code, headers=exc.headers)
+    return JSONResponse.from_bytes(
+        _render_http_error(exc), status_code=exc.code, headers=exc.headers
+    )
 
 
 async def msgspec_validation_error_handler(
@@ -6,6 +6,7 @@ import copy
 import math
 import operator
 import typing as t
+from contextvars import ContextVar
 from functools import partial
 
 F = t.TypeVar("F", bound=t.Callable[..., t.Any])
@@ -165,34 +166,54 @@ class LocalProxy:
     issubclass(type(user), LocalProxy)  # True
     ```
 
+    A `ContextVar` can be proxied directly, its value is read with a single `ContextVar.get` call.
+
+    ```python
+    from contextvars import ContextVar
+    _request_ctx = ContextVar("_request_ctx")
+
+    # a proxy to whatever _request_ctx is set to
+    request = LocalProxy(_request_ctx)
+    ```
+
     Args:
-        local: callable that provides the proxied object.
-        name: The attribute name to look up on a `Local`. Not used if a callable is given.
+        local: `ContextVar` or callable that provides the proxied object.
+        name: The attribute name to look up on a `Local`. Not used if a `ContextVar` or a callable is given.
 
     """
 
-    __slots__ = ("__local", "__name", "__wrapped__")
+    __slots__ = ("__local", "__name", "__get", "__wrapped__")
 
     def __init__(
         self,
-        local: t.Callable[[], t.Any],
+        local: t.Union[ContextVar, t.Callable[[], t.Any]],
         name: t.Optional[str] = None,
     ) -> None:
         object.__setattr__(self, "_LocalProxy__local", local)
         object.__setattr__(self, "_LocalProxy__name", name)
-
-        if callable(local) and not hasattr(local, "__release_local__"):
+        # The function returning the proxied object, bound once as it's called for every access.
+        get: t.Optional[t.Callable[[], t.Any]] = None
+        if isinstance(local, ContextVar):
+            get = local.get
+            object.__setattr__(self, "_LocalProxy__name", local.name)
+        elif callable(local) and not hasattr(local, "__release_local__"):
             # "local" is a callable that is not an instance of Local or
             # LocalManager: mark it as a wrapped function.
             object.__setattr__(self, "__wrapped__", local)
+            get = local
+        object.__setattr__(self, "_LocalProxy__get", get)
 
     def _get_current_object(self) -> t.Any:
         """Return the current object.  This is useful if you want the real
         object behind the proxy at a time for performance reasons or because
         you want to pass the object into a different context.
         """
-        if not hasattr(self.__local, "__release_local__"):  # type: ignore
-            return self.__local()  # type: ignore
+        get = self.__get  # type: ignore
+        if get is not None:
+            try:
+                return get()
+            except LookupError:
+                raise RuntimeError(f"no object bound to {self.__name}") from None
 
         try:  # pragma: no cover
             return getattr(self.__local, self.__name)  # type: ignore
@@ -218,7 +239,11 @@ class LocalProxy:
     __ge__ = _ProxyLookup(operator.ge)
     __hash__ = _ProxyLookup(hash)  # type: ignore
     __bool__ = _ProxyLookup(bool, fallback=lambda self: False)
-    __getattr__ = _ProxyLookup(getattr)
+
+    def __getattr__(self, name: str) -> t.Any:
+        # A plain method instead of a `_ProxyLookup`, attribute access is the most common operation on the proxy.
+        return getattr(self._get_current_object(), name)
+
     # __getattribute__ triggered through __getattr__
     __setattr__ = _ProxyLookup(setattr)  # type: ignore
     __delattr__ = _ProxyLookup(delattr)  # type: ignore
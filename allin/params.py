@@ -1,4 +1,4 @@
-from typing import Any, Iterable
+from typing import Any, Iterable, Union
 
 from aiofiles.tempfile import SpooledTemporaryFile
 from aiofiles.tempfile.temptypes import AsyncSpooledTemporaryFile
@@ -60,7 +60,7 @@ class UploadFile:
         )
         return instance
 
-    async def write(self, data: bytes):
+    async def write(self, data: Union[bytes, bytearray, memoryview]):
         return await self.fp.write(data)
 
     async def writelines(self, data: Iterable):
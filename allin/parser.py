@@ -1,8 +1,7 @@
 from enum import IntEnum
-from functools import cached_property
-from typing import Any, Optional, Union
+from typing import Any, NoReturn, Optional, Union
 
-from multipart.multipart import MultipartParser, parse_options_header
+from multipart.multipart import parse_options_header
 
 from .errors import HTTPError
 from .params import BodyPart, UploadFile
@@ -10,203 +9,329 @@ from .status import status_codes
 from .stream import BodyStream
 
 
+def _parse_content_length(value: Optional[Union[str, bytes]]) -> int:
+    """
+    Parse the 'content-length' header value, decoded or raw. An empty or invalid value is read as 0,
+    so it doesn't fail the request.
+    """
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
 class HttpHeaders(dict):
+    """
+    HTTP request headers, keyed by the lowercase header names (see `parse_headers`).
+
+    The common headers are read once when the object is created, and are available as attributes.
+    """
+
+    __slots__ = (
+        "user_agent",
+        "host",
+        "connection",
+        "accept",
+        "referer",
+        "accept_encoding",
+        "accept_language",
+        "content_type",
+        "content_length",
+    )
+
     def __init__(self, raw: dict[str, str]) -> None:
         super().__init__(raw)
-
-    def __setitem__(self, __key: str, __value: str) -> None:
+        get = raw.get
+        self.user_agent: Optional[str] = get("user-agent")
+        self.host: Optional[str] = get("host")
+        self.connection: Optional[str] = get("connection")
+        self.accept: Optional[str] = get("accept")
+        self.referer: Optional[str] = get("referer")
+        self.accept_encoding: Optional[str] = get("accept-encoding")
+        self.accept_language: Optional[str] = get("accept-language")
+        self.content_type: Optional[str] = get("content-type")
+        self.content_length: int = _parse_content_length(get("content-length"))
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
         raise NotImplementedError("You cannot modify the HTTP request header")
 
-    def __getitem__(self, k: str):
-        k = k.lower()
-        return super().__getitem__(k)
+    # Every `dict` method modifying the headers in place is disabled, not only `__setitem__`.
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __missing__(self, k: str) -> str:
+        # The keys are lowercase already, so only a key in another case has to be lowercased.
+        lower_k = k.lower()
+        if lower_k == k:
+            raise KeyError(k)
+        return self[lower_k]
 
     def get(self, k: str, default: Any = None) -> str:
+        if k in self:
+            return dict.__getitem__(self, k)
         return super().get(k.lower(), default)
 
-    @cached_property
-    def user_agent(self) -> Optional[str]:
-        return self.get("user-agent")
+    def __str__(self) -> str:
+        return f"<{type(self).__name__}: {dict(self)}>"
 
-    @cached_property
-    def host(self) -> Optional[str]:
-        return self.get("host")
 
-    @cached_property
-    def connection(self) -> Optional[str]:
-        return self.get("connection")
+# Lowercase names of the request headers seen so far, keyed by the raw names. Clients send mostly the same
+# few header names, so each name is lowercased and decoded only once.
+# It is emptied once it's full, so clients sending arbitrary header names can neither grow it indefinitely
+# nor fill it up for good.
+_HEADER_NAMES: dict[bytes, str] = {}
+_HEADER_NAMES_SIZE = 512
 
-    @cached_property
-    def accept(self) -> Optional[str]:
-        return self.get("accept")
 
-    @cached_property
-    def referer(self) -> Optional[str]:
-        return self.get("referer")
+def _decode_header_name(name: bytes) -> str:
+    decoded = name.lower().decode("latin-1")
+    if len(_HEADER_NAMES) >= _HEADER_NAMES_SIZE:
+        _HEADER_NAMES.clear()
+    _HEADER_NAMES[name] = decoded
+    return decoded
 
-    @cached_property
-    def accept_encoding(self) -> Optional[str]:
-        return self.get("accept-encoding")
 
-    @cached_property
-    def accept_language(self) -> Optional[str]:
-        return self.get("accept-language")
+def parse_headers(headers: list[tuple[bytes, bytes]]) -> HttpHeaders:
+    get_name = _HEADER_NAMES.get
+    data = {
+        get_name(k) or _decode_header_name(k): v.decode("latin-1") for k, v in headers
+    }
+    return HttpHeaders(data)
 
-    @cached_property
-    def content_type(self) -> Optional[str]:
-        return self.get("content-type")
 
-    @cached_property
-    def content_length(self) -> Optional[int]:
-        return int(self.get("content-length", 0))
+def find_raw_header(headers: list[tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    """Look up a single header in the raw ASGI headers, without parsing all of them.
 
-    def __str__(self) -> str:
-        return f"<{type(self).__name__}: {dict(self)}>"
+    Args:
+        headers: Raw ASGI headers
+        name: Lowercase header name
+    """
+    for k, v in headers:
+        if k.lower() == name:
+            return v
+    return None
 
 
-def parse_headers(headers: list[tuple[bytes, bytes]]) -> HttpHeaders:
-    data = {k.lower().decode("latin-1"): v.decode("latin-1") for k, v in headers}
-    return HttpHeaders(data)
+def _invalid_form_data() -> HTTPError:
+    return HTTPError(
+        status_codes.UNSUPPORTED_MEDIA_TYPE,
+        detail="Invalid multipart/form-data request.",
+    )
 
 
-class MultiPartMessage(IntEnum):
+class _ScanState(IntEnum):
     """
-    This is part of the `starlette`.
-    See: https://github.com/encode/starlette/blob/master/starlette/formparsers.py#L23
+    The position of `FormDataParser` in the multipart/form-data body.
     """
 
-    PART_BEGIN = 1
-    PART_DATA = 2
-    PART_END = 3
-    HEADER_FIELD = 4
-    HEADER_VALUE = 5
-    HEADER_END = 6
-    HEADERS_FINISHED = 7
-    END = 8
+    PREAMBLE = 0  # Before the first boundary
+    DELIMITER = 1  # Right after a boundary, either CRLF (next part) or "--" (end of the body) follows
+    HEADERS = 2  # Header lines of the current part
+    PART_DATA = 3  # Data of the current part, until the next boundary
+    END = 4  # After the closing boundary, the epilogue is ignored
 
 
 class FormDataParser:
     """
-    This is part of the `starlette`.
-    See: https://github.com/encode/starlette/blob/master/starlette/formparsers.py#L118
+    A streaming multipart/form-data parser.
 
-    There are only a few changes to suit the `Allin` framework.
+    Each chunk is scanned with `bytes.find` for the part boundary, so the part data is handled in the largest possible
+    slices instead of by per-event callbacks. Only the tail of a chunk that may hold the beginning of a boundary
+    is carried over to the next chunk.
     """
 
+    charset = "latin-1"
+    # Minimum size of the data handed to the scanner at once, except for the end of the body.
+    chunk_size = 64 * 1024
+
     def __init__(self, content_type: str) -> None:
         _, params = parse_options_header(content_type)
         boundary = params.get(b"boundary")
-        callbacks = {
-            "on_part_begin": self.on_part_begin,
-            "on_part_data": self.on_part_data,
-            "on_part_end": self.on_part_end,
-            "on_header_field": self.on_header_field,
-            "on_header_value": self.on_header_value,
-            "on_header_end": self.on_header_end,
-            "on_headers_finished": self.on_headers_finished,
-            "on_end": self.on_end,
-        }
-        self.parser = MultipartParser(boundary, callbacks=callbacks)
-        self._body_parts: list[tuple[MultiPartMessage, bytes]] = []
-
-    def on_part_begin(self):
-        self._body_parts.append((MultiPartMessage.PART_BEGIN, b""))
-
-    def on_part_data(self, data: bytes, start: int, end: int):
-        value = data[start:end]
-        self._body_parts.append((MultiPartMessage.PART_DATA, value))
-
-    def on_part_end(self):
-        self._body_parts.append((MultiPartMessage.PART_END, b""))
-
-    def on_header_field(self, data: bytes, start: int, end: int):
-        header_name = data[start:end]
-        self._body_parts.append((MultiPartMessage.HEADER_FIELD, header_name))
-
-    def on_header_value(self, data: bytes, start: int, end: int):
-        header_value = data[start:end]
-        self._body_parts.append((MultiPartMessage.HEADER_VALUE, header_value))
-
-    def on_header_end(self):
-        self._body_parts.append((MultiPartMessage.HEADER_END, b""))
-
-    def on_headers_finished(self):
-        self._body_parts.append((MultiPartMessage.HEADERS_FINISHED, b""))
-
-    def on_end(self):
-        self._body_parts.append((MultiPartMessage.END, b""))
-
-    async def parse(self, stream: BodyStream):  # noqa: C901
-        header_field = b""
-        header_value = b""
-        content_disposition = None
-        content_type = b""
-        field_name = ""
-        data = b""
-        file: Optional[UploadFile] = None
-        items: list[tuple[str, Union[BodyPart, UploadFile]]] = []
-        item_headers: list[tuple[str, str]] = []
-        charset = "latin-1"
+        if not boundary:
+            raise HTTPError(
+                status_codes.UNSUPPORTED_MEDIA_TYPE,
+                detail="Invalid multipart/form-data request. Missing boundary.",
+            )
+
+        self._first_delimiter = b"--" + boundary
+        self._delimiter = b"\r\n--" + boundary
+        self._state = _ScanState.PREAMBLE
+        self._residual = b""
+        self._items: list[tuple[str, Union[BodyPart, UploadFile]]] = []
+        # The current part
+        self._item_headers: list[tuple[str, str]] = []
+        self._content_disposition: Optional[bytes] = None
+        self._content_type = b""
+        self._field_name = ""
+        self._data = bytearray()
+        self._file: Optional[UploadFile] = None
+
+    def _scan_preamble(self, chunk: bytes, pos: int) -> Optional[int]:
+        idx = chunk.find(self._first_delimiter, pos)
+        if idx == -1:
+            keep = len(self._first_delimiter) - 1
+            self._residual = chunk[max(pos, len(chunk) - keep) :]
+            return None
+
+        self._state = _ScanState.DELIMITER
+        return idx + len(self._first_delimiter)
+
+    def _scan_delimiter(self, chunk: bytes, pos: int) -> Optional[int]:
+        suffix = chunk[pos : pos + 2]
+        if len(suffix) < 2:
+            self._residual = suffix
+            return None
+
+        if suffix == b"--":
+            self._state = _ScanState.END
+        elif suffix == b"\r\n":
+            self._item_headers = []
+            self._content_disposition = None
+            self._content_type = b""
+            self._data = bytearray()
+            self._file = None
+            self._state = _ScanState.HEADERS
+        else:
+            raise _invalid_form_data()
+        return pos + 2
+
+    async def _scan_headers(self, chunk: bytes, pos: int) -> Optional[int]:
+        charset = self.charset
+        while True:
+            idx = chunk.find(b"\r\n", pos)
+            if idx == -1:
+                self._residual = chunk[pos:]
+                return None
+            if idx == pos:
+                # An empty line ends the headers.
+                await self._on_headers_finished()
+                self._state = _ScanState.PART_DATA
+                return idx + 2
+
+            field, sep, value = chunk[pos:idx].partition(b":")
+            if not sep:
+                raise _invalid_form_data()
+            field = field.strip().lower()
+            value = value.strip()
+            if field == b"content-disposition":
+                self._content_disposition = value
+            elif field == b"content-type":
+                self._content_type = value
+            self._item_headers.append((field.decode(charset), value.decode(charset)))
+            pos = idx + 2
+
+    async def _scan_part_data(self, chunk: bytes, pos: int) -> Optional[int]:
+        idx = chunk.find(self._delimiter, pos)
+        if idx == -1:
+            # The end of the chunk may be the beginning of the next boundary.
+            end = max(pos, len(chunk) - len(self._delimiter) + 1)
+            if end > pos:
+                await self._on_part_data(memoryview(chunk)[pos:end])
+            self._residual = chunk[end:]
+            return None
+
+        if idx > pos:
+            await self._on_part_data(memoryview(chunk)[pos:idx])
+        await self._on_part_end()
+        self._state = _ScanState.DELIMITER
+        return idx + len(self._delimiter)
+
+    async def _on_headers_finished(self) -> None:
+        charset = self.charset
+        if self._content_disposition is None:
+            raise _invalid_form_data()
+
+        _, options = parse_options_header(self._content_disposition)
+        try:
+            self._field_name = options[b"name"].decode(charset)
+        except KeyError as e:
+            raise HTTPError(
+                status_codes.UNSUPPORTED_MEDIA_TYPE,
+                detail="Invalid multipart/form-data request. Missing 'name' field.",
+            ) from e
+
+        if b"filename" in options:
+            self._file = await UploadFile.create(
+                filename=options[b"filename"].decode(charset),
+                content_type=self._content_type.decode(charset),
+                headers=dict(self._item_headers),
+            )
+
+    async def _on_part_data(self, data: Union[bytes, memoryview]) -> None:
+        # The data is a view on the chunk, both the buffer and the file copy it without an intermediate `bytes`.
+        if self._file is None:
+            self._data.extend(data)
+        else:
+            await self._file.write(data)
+
+    async def _on_part_end(self) -> None:
+        charset = self.charset
+        if self._file is None:
+            part = BodyPart(
+                self._data.decode(charset),
+                self._content_type.decode(charset),
+                headers=dict(self._item_headers),
+            )
+            self._items.append((self._field_name, part))
+        else:
+            await self._file.seek(0)
+            self._items.append((self._field_name, self._file))
+
+    async def _merge_residual(self, chunk: bytes) -> bytes:
+        """
+        Prepend the tail carried over from the previous chunk.
+
+        While in the part data, the tail is just data unless a boundary starts in it. That is checked on a window
+        as long as a boundary, so the (possibly large) chunk doesn't have to be copied in the common case.
+        """
+        residual = self._residual
+        self._residual = b""
+        if self._state is _ScanState.PART_DATA:
+            lookahead = len(self._delimiter) - 1
+            if (
+                len(chunk) >= lookahead
+                and self._delimiter not in residual + chunk[:lookahead]
+            ):
+                await self._on_part_data(residual)
+                return chunk
+        return residual + chunk
+
+    async def write(self, chunk: bytes) -> None:
+        """
+        Scan the next chunk of the request body.
+        """
+        if self._residual:
+            chunk = await self._merge_residual(chunk)
+
+        pos = 0
+        while pos is not None:
+            # Ordered by frequency, most of the body is part data.
+            state = self._state
+            if state is _ScanState.PART_DATA:
+                pos = await self._scan_part_data(chunk, pos)
+            elif state is _ScanState.HEADERS:
+                pos = await self._scan_headers(chunk, pos)
+            elif state is _ScanState.DELIMITER:
+                pos = self._scan_delimiter(chunk, pos)
+            elif state is _ScanState.PREAMBLE:
+                pos = self._scan_preamble(chunk, pos)
+            else:
+                return
+
+    async def parse(self, stream: BodyStream):
+        # Small chunks from the ASGI server are merged up to `chunk_size` bytes before they are scanned.
+        buffer = bytearray()
+        chunk_size = self.chunk_size
         async for chunk in stream:
-            # print("Chunk:", len(chunk))
-            self.parser.write(chunk)
-            parts = list(self._body_parts)
-            self._body_parts.clear()
-            for message_type, message_bytes in parts:
-                if message_type == MultiPartMessage.PART_BEGIN:
-                    content_disposition = None
-                    content_type = b""
-                    data = b""
-                    item_headers = []
-                elif message_type == MultiPartMessage.HEADER_FIELD:
-                    header_field += message_bytes
-                elif message_type == MultiPartMessage.HEADER_VALUE:
-                    header_value += message_bytes
-                elif message_type == MultiPartMessage.HEADER_END:
-                    field = header_field.lower()
-                    if field == b"content-disposition":
-                        content_disposition = header_value
-                    elif field == b"content-type":
-                        content_type = header_value
-                    item_headers.append(
-                        (field.decode(charset), header_value.decode(charset))
-                    )
-                    header_field = b""
-                    header_value = b""
-                elif message_type == MultiPartMessage.HEADERS_FINISHED:
-                    disposition, options = parse_options_header(content_disposition)
-                    try:
-                        field_name = options[b"name"].decode(charset)
-                    except KeyError as e:
-                        raise HTTPError(
-                            status_codes.UNSUPPORTED_MEDIA_TYPE,
-                            detail="Invalid multipart/form-data request. Missing 'name' field.",
-                        ) from e
-
-                    if b"filename" in options:
-                        filename = options[b"filename"].decode(charset)
-                        file = await UploadFile.create(
-                            filename=filename,
-                            content_type=content_type.decode(charset),
-                            headers=dict(item_headers),
-                        )
-                    else:
-                        file = None
-                elif message_type == MultiPartMessage.PART_DATA:
-                    if file is None:
-                        data += message_bytes
-                    else:
-                        await file.write(message_bytes)
-                elif message_type == MultiPartMessage.PART_END:
-                    if file is None:
-                        part = BodyPart(
-                            data.decode(charset),
-                            content_type.decode(charset),
-                            headers=dict(item_headers),
-                        )
-                        items.append((field_name, part))
-                    else:
-                        await file.seek(0)
-                        items.append((field_name, file))
-        self.parser.finalize()
-        return items
+            if not buffer and len(chunk) >= chunk_size:
+                await self.write(chunk)
+                continue
+
+            buffer += chunk
+            if len(buffer) >= chunk_size:
+                await self.write(bytes(buffer))
+                buffer.clear()
+
+        if buffer:
+            await self.write(bytes(buffer))
+        return self._items
@@ -4,11 +4,11 @@ from typing import Any, Callable, Optional, Union
 from asgi_typing import HTTPScope
 from biscuits import parse as parse_cookie
 from fast_query_parsers import parse_query_string, parse_url_encoded_dict
-from msgspec import Struct, json, msgpack
+from msgspec import Struct, from_builtins, json, msgpack
 
 from .errors import MediaTypeError
 from .params import BodyPart, UploadFile
-from .parser import FormDataParser, HttpHeaders
+from .parser import FormDataParser, HttpHeaders, parse_headers
 from .stream import BodyStream
 
 
@@ -28,13 +28,24 @@ class Request:
         self, stream: BodyStream, scope: HTTPScope, *, headers: HttpHeaders = None
     ) -> None:
         self.stream = stream
-        self.headers = headers
         self.scope = scope
-        self._query = {}
+        self._headers = headers
+        self._mimetype: Optional[str] = None
+        self._query: Optional[dict[str, Any]] = None
         self._forms: dict[str, Optional[Union[str, UploadFile]]] = {}
         self._json = {}
         self._msgpack = {}
 
+    @property
+    def headers(self) -> HttpHeaders:
+        """
+        HTTP request headers. They are parsed from the ASGI scope on first access.
+        """
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = parse_headers(self.scope["headers"])
+        return headers
+
     async def body(self) -> bytes:
         """
         Get all request bodies in one fetch.
@@ -91,12 +102,17 @@ class Request:
         content_type = self.headers.content_type
         has_error = False
         if media_types and content_type:
-            if deep_check:
-                has_error = not any(
-                    filter(lambda x: content_type.startswith(x.strip()), media_types)
+            mimetype = self._mimetype
+            if mimetype is None:
+                # The content type without its parameters (e.g. charset), computed once per request.
+                mimetype = self._mimetype = (
+                    content_type.partition(";")[0].strip().lower()
                 )
-            else:
-                has_error = self.content_type not in media_types
+            has_error = (
+                not mimetype.startswith(tuple(media_types))
+                if deep_check
+                else mimetype not in media_types
+            )
             if has_error and not silent:
                 raise MediaTypeError(
                     f"Client asks for {content_type} but you expect {media_type!r}"
@@ -107,20 +123,13 @@ class Request:
         """
         Parse the query string to a dictionary.
         """
-        if self._query:
+        if self._query is not None:
             return self._query
         qs: bytes = self.scope["query_string"]
-        query = {}
+        values: dict[str, list[str]] = {}
         for k, v in parse_query_string(qs, separator):
-            kv = query.get(k)
-            if k in query:
-                if not isinstance(kv, list):
-                    v = [kv, v]
-                else:
-                    kv.append(v)
-                    v = kv
-            query[k] = v
-        self._query = query
+            values.setdefault(k, []).append(v)
+        self._query = {k: v[0] if len(v) == 1 else v for k, v in values.items()}
         return self._query
 
     async def json(
@@ -142,7 +151,7 @@ class Request:
             return self._json
 
         if self._check_media_type("json", silent=True):
-            body = await self.body()
+            body = await self.stream.read_all()
             data = json.decode(body, type=schema, dec_hook=decode_hook)
             self._json = data
 
@@ -166,7 +175,7 @@ class Request:
             return self._msgpack
 
         if self._check_media_type("msgpack", silent=True):
-            body = await self.body()
+            body = await self.stream.read_all()
             data = msgpack.decode(body, type=schema, dec_hook=decode_hook)
             self._msgpack = data
         return self._msgpack
@@ -184,8 +193,8 @@ class Request:
         Args:
             schema: `msgspec.Struct` object to validate request body.
                     If given, it will run validation (Only for `application/x-www-form-urlencoded`). Defaults to None.
-            encode_hook: See https://jcristharif.com/msgspec/api.html#msgspec.json.encode. Defaults to None.
-            decode_hook: See https://jcristharif.com/msgspec/api.html#msgspec.json.decode. Defaults to None.
+            encode_hook: Unused, the form data is validated without encoding it. It is kept for backward compatibility.
+            decode_hook: See https://jcristharif.com/msgspec/api.html#msgspec.from_builtins. Defaults to None.
 
         Returns:
             Dict[str, Any]: if request body is `application/x-www-form-urlencoded`
@@ -198,27 +207,16 @@ class Request:
             body = await self.body()
             data = parse_url_encoded_dict(body)
             if schema:
-                json.decode(
-                    json.encode(data, enc_hook=encode_hook),
-                    type=schema,
-                    dec_hook=decode_hook,
-                )
+                from_builtins(data, schema, dec_hook=decode_hook)
 
             self._forms = data
 
         elif self._check_media_type("form-data", deep_check=True, silent=True):
             parser = FormDataParser(self.headers.content_type)
-            forms = {}
             items = await parser.parse(self.stream)
+            values: dict[str, list[Union[BodyPart, UploadFile]]] = {}
             for field_name, field_value in items:
-                if field_name in forms:
-                    fv = forms.get(field_name)
-                    if not isinstance(fv, list):
-                        fv = [fv, field_value]
-                    else:
-                        fv.append(field_value)
-                    field_value = fv
-                forms[field_name] = field_value
-            self._forms = forms
+                values.setdefault(field_name, []).append(field_value)
+            self._forms = {k: v[0] if len(v) == 1 else v for k, v in values.items()}
 
         return self._forms
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Any, Callable, Literal, Optional, Union
+from typing import Any, AsyncIterable, Callable, Literal, Optional, Union
 
-from asgi_typing import ASGISendCallable
+from asgi_typing import ASGISendCallable, ASGISendEvent
 from biscuits import Cookie
 from msgspec import json, msgpack
 
@@ -9,6 +9,105 @@ from .status import status_codes
 
 SAMESITE_COOKIE_VALUES = Literal["strict", "lax", "none"]
 
+_CONTENT_LENGTH = b"content-length"
+_CONTENT_TYPE = b"content-type"
+
+# Encoded (lowercase) names of the response headers seen so far. Responses mostly use the same few header names,
+# so each name is lowercased and encoded only once. It is emptied once it's full, in case the names are dynamic.
+_HEADER_NAMES: dict[str, bytes] = {}
+_HEADER_NAMES_SIZE = 512
+
+
+def _encode_header_name(name: str) -> bytes:
+    encoded = name.lower().encode("latin-1")
+    if len(_HEADER_NAMES) >= _HEADER_NAMES_SIZE:
+        _HEADER_NAMES.clear()
+    _HEADER_NAMES[name] = encoded
+    return encoded
+
+
+_SAMESITE_VALUES = frozenset(SAMESITE_COOKIE_VALUES.__args__)
+# Characters of the cookie values that are sent as is, other values are quoted by `biscuits`.
+_COOKIE_VALUE_CHARS = frozenset(
+    "!#$%&'*+-.0123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZ^_`abcdefghijklmnopqrstuvwxyz|~"
+)
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+# The 'expires' attribute of deleted cookies
+_EXPIRED = datetime(1970, 1, 1)
+
+
+def _check_samesite(samesite: Optional[str]) -> None:
+    if samesite is not None and samesite not in _SAMESITE_VALUES:
+        raise ValueError(
+            f"the 'samesite' cookie value must be {SAMESITE_COOKIE_VALUES.__args__}"
+        )
+
+
+def _format_cookie(
+    name: str,
+    value: str,
+    path: Optional[str],
+    domain: Optional[str],
+    secure: bool,
+    httponly: bool,
+    max_age: int,
+    expires: Optional[datetime],
+    samesite: Optional[str],
+) -> bytes:
+    """
+    Format the 'set-cookie' header value, the same way as `str(biscuits.Cookie(...))`.
+    Only values which need quoting go through `biscuits`, the others are formatted directly.
+    """
+    if not _COOKIE_VALUE_CHARS.issuperset(value):
+        cookie = Cookie(
+            name,
+            value,
+            path=path,
+            domain=domain,
+            secure=secure,
+            httponly=httponly,
+            max_age=max_age,
+            expires=expires,
+            samesite=samesite,
+        )
+        return str(cookie).encode("latin-1")
+
+    if not value:
+        value = '""'
+    parts = [f"{name}={value}"]
+    if expires is not None:
+        parts.append(
+            f"Expires={_WEEKDAYS[expires.weekday()]}, {expires.day:02d} {_MONTHS[expires.month - 1]} "
+            f"{expires.year:04d} {expires.hour:02d}:{expires.minute:02d}:{expires.second:02d} GMT"
+        )
+    if max_age:
+        parts.append(f"Max-Age={max_age}")
+    if domain:
+        parts.append(f"Domain={domain}")
+    if path:
+        parts.append(f"Path={path}")
+    if secure:
+        parts.append("Secure")
+    if httponly:
+        parts.append("HttpOnly")
+    if samesite:
+        parts.append(f"SameSite={samesite}")
+    return "; ".join(parts).encode("latin-1")
+
 
 class Response:
     """
@@ -36,6 +135,32 @@ class Response:
         self.body = self.render(content)
         self.raw_headers = self.init_headers(headers)
 
+    @classmethod
+    def from_bytes(
+        cls,
+        body: bytes,
+        *,
+        status_code: Union[int, status_codes] = 200,
+        headers: dict[str, Any] = None,
+        media_type: Optional[str] = None,
+    ) -> "Response":
+        """Create a response from an already rendered body, `render` is not called.
+
+        Args:
+            body: Rendered response body
+            status_code: HTTP status code
+            headers: HTTP headers
+            media_type: Content type of the response body
+        """
+        response = cls.__new__(cls)
+        response.status_code = status_code
+        if media_type is not None:
+            response.media_type = media_type
+
+        response.body = body
+        response.raw_headers = response.init_headers(headers)
+        return response
+
     def render(self, content: Any) -> bytes:
         if content is None:
             return b""
@@ -46,18 +171,18 @@ class Response:
     def init_headers(
         self, headers: Optional[dict[str, str]] = None
     ) -> list[tuple[bytes, bytes]]:
-        if headers is None:
-            raw_headers: list[tuple[bytes, bytes]] = []
-            populate_content_length = True
-            populate_content_type = True
-        else:
-            raw_headers = [
-                (k.lower().encode("latin-1"), v.encode("latin-1"))
-                for k, v in headers.items()
-            ]
-            keys = [h[0] for h in raw_headers]
-            populate_content_length = b"content-length" not in keys
-            populate_content_type = b"content-type" not in keys
+        raw_headers: list[tuple[bytes, bytes]] = []
+        populate_content_length = True
+        populate_content_type = True
+        if headers is not None:
+            get_name = _HEADER_NAMES.get
+            for k, v in headers.items():
+                name = get_name(k) or _encode_header_name(k)
+                if name == _CONTENT_LENGTH:
+                    populate_content_length = False
+                elif name == _CONTENT_TYPE:
+                    populate_content_type = False
+                raw_headers.append((name, v.encode("latin-1")))
 
         body = getattr(self, "body", None)
         if (
@@ -66,13 +191,13 @@ class Response:
             and not (self.status_code < 200 or self.status_code in (204, 304))
         ):
             content_length = str(len(body))
-            raw_headers.append((b"content-length", content_length.encode("latin-1")))
+            raw_headers.append((_CONTENT_LENGTH, content_length.encode("latin-1")))
 
         content_type = self.media_type
         if content_type is not None and populate_content_type:
             if content_type.startswith("text/"):
                 content_type += "; charset=" + self.charset
-            raw_headers.append((b"content-type", content_type.encode("latin-1")))
+            raw_headers.append((_CONTENT_TYPE, content_type.encode("latin-1")))
 
         return raw_headers
 
@@ -88,24 +213,11 @@ class Response:
         expires: datetime = None,
         samesite: Optional[SAMESITE_COOKIE_VALUES] = "lax",
     ):
-        if samesite is not None and samesite not in SAMESITE_COOKIE_VALUES.__args__:
-            raise ValueError(
-                f"the 'samesite' cookie value must be {SAMESITE_COOKIE_VALUES.__args__}"
-            )
-        cookie = str(
-            Cookie(
-                name,
-                value,
-                path=path,
-                domain=domain,
-                secure=secure,
-                httponly=httponly,
-                max_age=max_age,
-                expires=expires,
-                samesite=samesite,
-            )
+        _check_samesite(samesite)
+        cookie = _format_cookie(
+            name, value, path, domain, secure, httponly, max_age, expires, samesite
         )
-        self.raw_headers.append((b"set-cookie", cookie.encode("latin-1")))
+        self.raw_headers.append((b"set-cookie", cookie))
 
     def delete_cookie(
         self,
@@ -116,26 +228,27 @@ class Response:
         httponly: bool = False,
         samesite: Optional[SAMESITE_COOKIE_VALUES] = "lax",
     ):
-        self.set_cookie(
-            name,
-            max_age=0,
-            expires=0,
-            path=path,
-            domain=domain,
-            secure=secure,
-            httponly=httponly,
-            samesite=samesite,
+        _check_samesite(samesite)
+        cookie = _format_cookie(
+            name, "", path, domain, secure, httponly, 0, _EXPIRED, samesite
         )
+        self.raw_headers.append((b"set-cookie", cookie))
 
     async def __call__(self, send: ASGISendCallable) -> None:
-        await send(
-            {
-                "type": "http.response.start",
-                "status": int(self.status_code),
-                "headers": self.raw_headers,
-            }
-        )
-        await send({"type": "http.response.body", "body": self.body})
+        # Build both ASGI messages up front so that nothing runs between the two sends,
+        # the server can then flush the status line, headers and body in one go.
+        start_message = {
+            "type": "http.response.start",
+            "status": int(self.status_code),
+            "headers": self.raw_headers,
+        }
+        body_message = {
+            "type": "http.response.body",
+            "body": self.body,
+            "more_body": False,
+        }
+        await send(start_message)
+        await send(body_message)
 
 
 class JSONResponse(Response):
@@ -152,3 +265,95 @@ class MessagePackResponse(Response):
 
     def render(self, content: Any) -> bytes:
         return msgpack.encode(content, enc_hook=self.encode_hook)
+
+
+class CoalescingSender:
+    """
+    Wrap the ASGI 'send' function to merge consecutive `http.response.body` messages (with `more_body=True`)
+    into one message, so that many small chunks don't end up as many small writes on the ASGI server.
+
+    The buffered body is sent once it reaches `max_size` bytes, and always together with the final body message.
+    """
+
+    __slots__ = ("_send", "_buffer", "max_size")
+
+    def __init__(self, send: ASGISendCallable, max_size: int = 64 * 1024) -> None:
+        self._send = send
+        self._buffer = bytearray()
+        self.max_size = max_size
+
+    async def flush(self) -> None:
+        """
+        Send the buffered body, if any.
+        """
+        if self._buffer:
+            body = bytes(self._buffer)
+            self._buffer.clear()
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+
+    async def __call__(self, message: ASGISendEvent) -> None:
+        if message["type"] != "http.response.body":
+            await self.flush()
+            await self._send(message)
+            return
+
+        self._buffer.extend(message.get("body", b""))
+        if message.get("more_body", False):
+            if len(self._buffer) >= self.max_size:
+                await self.flush()
+            return
+
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": False}
+        )
+
+
+class StreamingResponse(Response):
+    """
+    A response whose body is sent in chunks, produced by an async iterable.
+
+    Args:
+        content: Async iterable yielding the body chunks (`bytes` or `str`).
+        coalesce: Merge small chunks into larger writes (up to 64KB) before sending them. It trades latency
+                  for fewer writes, so leave it off for event streams where each chunk must be sent immediately.
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterable[Union[str, bytes]],
+        *,
+        status_code: Union[int, status_codes] = 200,
+        headers: dict[str, Any] = None,
+        media_type: Optional[str] = None,
+        coalesce: bool = False,
+    ) -> None:
+        self.status_code = status_code
+        if media_type is not None:
+            self.media_type = media_type
+
+        self.body_iterator = content
+        self.coalesce = coalesce
+        # The body size is not known up front, so no 'content-length' header will be populated.
+        self.body = None
+        self.raw_headers = self.init_headers(headers)
+
+    async def __call__(self, send: ASGISendCallable) -> None:
+        if self.coalesce:
+            send = CoalescingSender(send)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(self.status_code),
+                "headers": self.raw_headers,
+            }
+        )
+        async for chunk in self.body_iterator:
+            if not isinstance(chunk, bytes):
+                chunk = chunk.encode(self.charset)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
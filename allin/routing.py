@@ -1,7 +1,19 @@
 import asyncio
+import sys
+from collections import OrderedDict
 from enum import IntEnum
-from functools import partialmethod
-from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
+from functools import cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from autoroutes import Routes
 from typing_extensions import TypeAlias
@@ -17,16 +29,63 @@ class MatchingCode(IntEnum):
     UNSUPPORTED_METHODS = 2
 
 
+# The known HTTP methods, mapped to a single string object per method (string literals are interned).
+_HTTP_METHODS = {
+    m: m
+    for m in (
+        "GET",
+        "HEAD",
+        "POST",
+        "PUT",
+        "DELETE",
+        "CONNECT",
+        "OPTIONS",
+        "TRACE",
+        "PATCH",
+    )
+}
+
+
+def _normalize_methods(methods: Sequence[str]) -> list[str]:
+    """Uppercase and dedupe the HTTP methods, in order.
+    The methods are returned as the strings of `_HTTP_METHODS`, so the lookups in `Router.find`
+    compare them by identity.
+
+    Args:
+        methods: HTTP Methods
+
+    Raises:
+        EndpointError: if a method is unknown.
+    """
+    normalized: list[str] = []
+    for method in methods:
+        canonical = _HTTP_METHODS.get(method.upper())
+        if canonical is None:
+            raise EndpointError(f"Unknown HTTP method {method!r}")
+        if canonical not in normalized:
+            normalized.append(canonical)
+    return normalized
+
+
 MATCHED_ROUTE_TYPE: TypeAlias = tuple[
     Optional[dict[str, Any]], Optional[dict[str, Any]]
 ]
 
+# Shared (read-only) path parameters for endpoints matched on a static route.
+_EMPTY_PATH_PARAMS = MappingProxyType({})
+# The results of `Router.find` without an endpoint, they are the same for every lookup.
+_NOT_FOUND = (MatchingCode.NOT_FOUND, None, None)
+_UNSUPPORTED_METHODS = (MatchingCode.UNSUPPORTED_METHODS, None, None)
+
 
 class Converter:
     def __init__(self, name: str, param_type: Any) -> None:
         types = []
         is_optional = False
-        if get_origin(param_type) is Union:
+        # Most annotations are plain classes (int, str, UUID...), which don't need the `typing` introspection.
+        if isinstance(param_type, type):
+            types.append(param_type)
+        elif get_origin(param_type) is Union:
             type_args = get_args(param_type)
             if type(None) in type_args:
                 is_optional = True
@@ -40,20 +99,28 @@ class Converter:
         self.param_type = param_type
         self.is_optional = is_optional
         self.validators = [Validator(arg_type) for arg_type in types]
+        self._validator = self.validators[0] if len(self.validators) == 1 else None
 
     def __call__(self, value: Any) -> Any:
-        if self.is_optional and value is None:
-            return value
-        elif not self.is_optional and value is None:
+        if value is None:
+            if self.is_optional:
+                return value
             raise HTTPError(status_codes.NOT_FOUND)
 
+        if self._validator is not None:
+            # The common case (e.g. `id: int`) has a single validator.
+            err, rv = self._validator.validate(value)
+            if err:
+                raise HTTPError(status_codes.BAD_REQUEST, str(rv), path=self.name)
+            return rv
+
         max_length = len(self.validators)
         rv = None
         for idx, validator in enumerate(self.validators):
             err, rv = validator.validate(value)
             count = idx + 1
             if count == max_length and err:
-                raise HTTPError(status_codes.BAD_REQUEST, rv, path=self.name)
+                raise HTTPError(status_codes.BAD_REQUEST, str(rv), path=self.name)
 
             if not err:
                 # Do not continue validation if the value is correct.
@@ -62,6 +129,31 @@ class Converter:
         return rv
 
 
+# Converters are stateless, so the endpoints with the same parameter (name and type) share one.
+_CONVERTERS: dict[tuple[str, Any], Converter] = {}
+
+
+def _get_converter(name: str, param_type: Any) -> Converter:
+    try:
+        key = (name, param_type)
+        converter = _CONVERTERS.get(key)
+    except TypeError:
+        # e.g. `Annotated` with unhashable metadata
+        return Converter(name, param_type)
+
+    if converter is None:
+        converter = _CONVERTERS[key] = Converter(name, param_type)
+    return converter
+
+
+@cache
+def _get_type_hints(func: Callable) -> dict[str, Any]:
+    """
+    `get_type_hints` is slow, and it's called for the same function when it's added to several routes.
+    """
+    return get_type_hints(func, include_extras=True)
+
+
 class Endpoint:
     """
     A class for defining an endpoint.
@@ -71,16 +163,32 @@ class Endpoint:
         self.path = path
         self.func = func
         self.methods = methods
-        self.path_types = get_type_hints(func, include_extras=True)
+        # For the method check on every request, it has to be updated when `methods` changes.
+        self._method_set = frozenset(methods)
+        self.path_types = dict(_get_type_hints(func))
         self.converters: dict[str, Converter] = {}
         for param, param_type in self.path_types.items():
-            converter = Converter(param, param_type)
-            self.converters[param] = converter
+            if param == "return":
+                # The return annotation is not a parameter.
+                continue
+            self.converters[param] = _get_converter(param, param_type)
 
     async def __call__(self, **path_params: Any) -> Any:
+        if not path_params:
+            # Nothing to validate, e.g. for static routes.
+            return await self.func()
+
+        converters = self.converters
+        if not converters:
+            # Untyped parameters are passed as they are, there is nothing to convert.
+            if None in path_params.values():
+                # See the FIXME below
+                raise HTTPError(status_codes.NOT_FOUND)
+            return await self.func(**path_params)
+
         validated_params = {}
         for param, value in path_params.items():
-            conv = self.converters.get(param)
+            conv = converters.get(param)
             if conv:
                 value = conv(value)
             elif value is None:
@@ -93,11 +201,28 @@ class Endpoint:
         return await self.func(**validated_params)
 
 
+class _PrefixNode:
+    """
+    A node of the sub-router prefix tree, one node per URL segment.
+    """
+
+    __slots__ = ("children", "prefix", "router")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_PrefixNode"] = {}
+        self.prefix: Optional[str] = None
+        self.router: Optional["Router"] = None
+
+
 class Router:
     """
     A router to create/find an endpoint.
     """
 
+    # Maximum number of dynamic route lookups remembered by `Router.find`.
+    # It is bounded so that clients requesting arbitrary URLs can't grow it indefinitely.
+    LOOKUP_CACHE_SIZE = 1024
+
     def __init__(self, *, prefix: Optional[str] = None) -> None:
         """Create a router instance.
 
@@ -114,8 +239,21 @@ class Router:
         self.prefix = prefix or ""
         self.routes = Routes()
         self.sub_routers: dict[str, "Router"] = {}
-
-    def add_endpoint(self, path: str, func: Callable, *, methods: list[str]):
+        # Prefix tree of `self.sub_routers`, so a sub-router is resolved in a single walk over the path segments.
+        self._sub_router_tree = _PrefixNode()
+        self._sub_router_depth = 0
+        # Routes without path parameters, keyed by `(method, path)`.
+        # These are resolved with a single dict lookup instead of `self.routes.match(...)`.
+        self._static: dict[tuple[str, str], Endpoint] = {}
+        # LRU cache of dynamic route lookups, keyed by `(method, path)`.
+        self._lookup_cache: OrderedDict[
+            tuple[str, str],
+            tuple[
+                MatchingCode, Optional[Endpoint], Optional[tuple[tuple[str, Any], ...]]
+            ],
+        ] = OrderedDict()
+
+    def add_endpoint(self, path: str, func: Callable, *, methods: Sequence[str]):
         """Adding an endpoint to the router.
 
         Args:
@@ -124,31 +262,40 @@ class Router:
             methods: HTTP Methods
 
         Raises:
-            EndpointError: if endpoint already exists.
+            EndpointError: if endpoint already exists, or a method is unknown.
         """
         assert path.startswith("/"), "Path prefix must start with '/'"  # noqa: S101
         assert asyncio.iscoroutinefunction(
             func
         ), "The endpoint handler must be a coroutine function"  # noqa: S101
         assert isinstance(
-            methods, list
-        ), "'methods' param should be of type 'list'"  # noqa: S101
+            methods, (list, tuple)
+        ), "'methods' param should be of type 'list' or 'tuple'"  # noqa: S101
         path_endpoint = self.prefix + path
-        methods = list({m.upper() for m in methods})
-        matching_code, endpoint, _ = self.find(path_endpoint)
+        methods = _normalize_methods(methods)
+        # The path may belong to a sub-router, its endpoint (and lookups) are then owned by that router.
+        router, routed_path = self._resolve_sub_router(path_endpoint)
+        matching_code, endpoint, _ = router._match(routed_path)
         if matching_code == MatchingCode.FOUND:
-            changed = False
-            for method in methods:
-                if method not in endpoint.methods:
-                    endpoint.methods.append(method)
-                    changed = True
-            if not changed:
+            # `methods` is deduped already, so only the endpoint's methods have to be skipped.
+            existing = endpoint._method_set
+            new_methods = [method for method in methods if method not in existing]
+            if not new_methods:
                 raise EndpointError(f"Endpoint with path {path!r} already exists")
+            endpoint.methods.extend(new_methods)
+            endpoint._method_set = frozenset(endpoint.methods)
         else:
-            ep = Endpoint(path_endpoint, func, methods)
-            self.routes.add(path_endpoint, endpoint=ep)
+            router = self
+            endpoint = Endpoint(path_endpoint, func, methods)
+            self.routes.add(path_endpoint, endpoint=endpoint)
+
+        if "{" not in endpoint.path:
+            static_path = sys.intern(endpoint.path)
+            for method in endpoint.methods:
+                router._static[(method, static_path)] = endpoint
+        router._lookup_cache.clear()
 
-    def route(self, path: str, *, methods: list[str] = ["get", "head"]):  # noqa: B006
+    def route(self, path: str, *, methods: Sequence[str] = ("get", "head")):
         """
         Add an endpoint with a decorator style
         """
@@ -160,13 +307,33 @@ class Router:
         return inner
 
     # Another shortcut for adding an endpoint with a decorator style
-    get = partialmethod(route, methods=["get"])
-    head = partialmethod(route, methods=["head"])
-    post = partialmethod(route, methods=["post"])
-    put = partialmethod(route, methods=["put"])
-    delete = partialmethod(route, methods=["delete"])
-    patch = partialmethod(route, methods=["patch"])
-    options = partialmethod(route, methods=["options"])
+    def get(self, path: str):
+        """A shortcut for `route(path, methods=("get",))`."""
+        return self.route(path, methods=("get",))
+
+    def head(self, path: str):
+        """A shortcut for `route(path, methods=("head",))`."""
+        return self.route(path, methods=("head",))
+
+    def post(self, path: str):
+        """A shortcut for `route(path, methods=("post",))`."""
+        return self.route(path, methods=("post",))
+
+    def put(self, path: str):
+        """A shortcut for `route(path, methods=("put",))`."""
+        return self.route(path, methods=("put",))
+
+    def delete(self, path: str):
+        """A shortcut for `route(path, methods=("delete",))`."""
+        return self.route(path, methods=("delete",))
+
+    def patch(self, path: str):
+        """A shortcut for `route(path, methods=("patch",))`."""
+        return self.route(path, methods=("patch",))
+
+    def options(self, path: str):
+        """A shortcut for `route(path, methods=("options",))`."""
+        return self.route(path, methods=("options",))
 
     def find(
         self, path: str, method: Optional[str] = None
@@ -177,42 +344,96 @@ class Router:
             path: Route path endpoint
             method: HTTP Methods. Defaults to None.
         """
-        path_parts = path.split("/")
-        current_path = None
-        router = None
-        while len(path_parts) > 0:
-            current_path = "/".join(path_parts)
-            router = self.sub_routers.get(current_path)
-            if router:
+        router, path = self._resolve_sub_router(path)
+        if method is None:
+            return router._match(path, method)
+
+        endpoint = router._static.get((method, path))
+        if endpoint is not None:
+            return (MatchingCode.FOUND, endpoint, _EMPTY_PATH_PARAMS)
+
+        cache_key = (method, path)
+        lookup_cache = router._lookup_cache
+        cached = lookup_cache.get(cache_key)
+        if cached is not None:
+            lookup_cache.move_to_end(cache_key)
+            matching_code, endpoint, path_params = cached
+            if path_params is None:
+                # `_NOT_FOUND` or `_UNSUPPORTED_METHODS`
+                return cached
+            return (matching_code, endpoint, dict(path_params))
+
+        result = router._match(path, method)
+        matching_code, endpoint, path_params = result
+        lookup_cache[cache_key] = (
+            (matching_code, endpoint, tuple(path_params.items()))
+            if path_params is not None
+            else result
+        )
+        if len(lookup_cache) > self.LOOKUP_CACHE_SIZE:
+            lookup_cache.popitem(last=False)
+        return result
+
+    def _resolve_sub_router(self, path: str) -> tuple["Router", str]:
+        """Look for the sub-router with the longest prefix matching the path.
+
+        Args:
+            path: Route path endpoint
+
+        Returns:
+            The router to match the path against, and the path with its prefix rewritten for that router.
+        """
+        node = self._sub_router_tree
+        if not node.children:
+            return (self, path)
+
+        # The path is only split as deep as the deepest prefix, the rest stays in the last segment.
+        matched_node = None
+        for segment in path.split("/", self._sub_router_depth):
+            node = node.children.get(segment)
+            if node is None:
                 break
-            else:
-                path_parts.pop(-1)
+            if node.router is not None:
+                matched_node = node
 
-        if router:
-            path = path.replace(current_path, router.prefix)
-        else:
-            router = self
+        if matched_node is None:
+            return (self, path)
+
+        # The path starts with the matched prefix, so only that part is replaced.
+        router = matched_node.router
+        return (router, router.prefix + path[len(matched_node.prefix) :])
 
-        matched_route: MATCHED_ROUTE_TYPE = router.routes.match(path)
+    def _match(
+        self, path: str, method: Optional[str] = None
+    ) -> tuple[MatchingCode, Endpoint, dict[str, Any]]:
+        """Match the path against the routes of this router (sub-routers are not included).
+
+        Args:
+            path: Route path endpoint
+            method: HTTP Methods. Defaults to None.
+        """
+        matched_route: MATCHED_ROUTE_TYPE = self.routes.match(path)
         handler_params, path_params = matched_route
         if handler_params is None and path_params is None:
-            return (MatchingCode.NOT_FOUND, None, None)
+            return _NOT_FOUND
 
         endpoint: Endpoint = handler_params["endpoint"]
-        if method is not None and method.upper() not in endpoint.methods:
-            return (MatchingCode.UNSUPPORTED_METHODS, None, None)
+        # ASGI servers send the method in uppercase, so `.upper()` is only needed for other callers.
+        method_set = endpoint._method_set
+        if (
+            method is not None
+            and method not in method_set
+            and method.upper() not in method_set
+        ):
+            return _UNSUPPORTED_METHODS
 
         # because we use the `autoroutes` module when we define a path like `/{id:digit}`
         # and when a client visits the `/` page without supplying a path parameter
         # the value of `id` param is an empty string.
         # we should convert the empty string to None.
-        def _patch_path_values(item):
-            k, v = item
+        for k, v in path_params.items():
             if v == "":
-                v = None
-            path_params[k] = v
-
-        list(map(_patch_path_values, path_params.items()))
+                path_params[k] = None
         return (MatchingCode.FOUND, endpoint, path_params)
 
     def include_router(self, router: "Router"):
@@ -229,11 +450,28 @@ class Router:
         if router_url_prefix in self.sub_routers:
             raise EndpointError(f"Router with prefix {router.prefix!r} already exists")
 
-        self.sub_routers[router_url_prefix] = router
+        self._add_sub_router(router_url_prefix, router)
         for router_prefix, sub_router in router.sub_routers.items():
             inherited_prefix = self.prefix + router_prefix
             if inherited_prefix in self.sub_routers:
                 raise EndpointError(
                     f"Router with prefix {router_prefix!r} already exists"
                 )
-            self.sub_routers[inherited_prefix] = sub_router
+            self._add_sub_router(inherited_prefix, sub_router)
+
+    def _add_sub_router(self, prefix: str, router: "Router"):
+        """Register a sub-router under the URL prefix.
+
+        Args:
+            prefix: Full URL prefix of the sub-router
+            router: Router instance
+        """
+        self.sub_routers[prefix] = router
+        # The tree starts with the empty segment before the leading "/", like the segments of `path.split("/")`.
+        segments = prefix.split("/")
+        self._sub_router_depth = max(self._sub_router_depth, len(segments))
+        node = self._sub_router_tree
+        for segment in segments:
+            node = node.children.setdefault(sys.intern(segment), _PrefixNode())
+        node.prefix = prefix
+        node.router = router
@@ -1,5 +1,11 @@
+from typing import Union
+
 from asgi_typing import ASGIReceiveCallable
 
+# Maximum size of the buffer allocated up front by `BodyStream.read_all`. The content length comes from the client,
+# so bigger bodies grow the buffer as the chunks arrive instead.
+_PREALLOCATE_LIMIT = 1024 * 1024
+
 
 class BodyStream:
     """
@@ -11,14 +17,44 @@ class BodyStream:
     ) -> None:
         self._receive = receive
         self._buffer = initial_buffer
+        # Start of the unread data in `self._buffer`, partial reads move it instead of copying the rest.
+        self._offset = 0
         self._bytes_remaining = content_length - len(initial_buffer)
-        self._is_initial_buffer = True
+
+    @classmethod
+    def from_complete(cls, body: bytes) -> "BodyStream":
+        """
+        Create a stream for a request body that has been received completely.
+        Nothing is left to be received, so it doesn't need the ASGI 'receive' function.
+        """
+        stream = cls.__new__(cls)
+        stream._receive = None
+        stream._buffer = body
+        stream._offset = 0
+        stream._bytes_remaining = 0
+        return stream
+
+    @classmethod
+    def empty(cls) -> "BodyStream":
+        """
+        Create a stream of an empty request body. Reading it never modifies the stream,
+        so a single instance can be shared by all requests without a body.
+        """
+        return cls.from_complete(b"")
+
+    def _buffered(self) -> bytes:
+        """
+        The data received but not read yet, the data read already is dropped from the buffer.
+        """
+        if self._offset:
+            self._buffer = self._buffer[self._offset :]
+            self._offset = 0
+        return self._buffer
 
     async def __aiter__(self):
-        yield self._buffer
+        yield self._buffered()
         while self._bytes_remaining > 0:
             message = await self._receive()
-            self._is_initial_buffer = False
             chunk = message["body"]
             body_length = len(chunk)
             self._bytes_remaining -= body_length
@@ -29,32 +65,70 @@ class BodyStream:
                 break
             if self._bytes_remaining <= 0:
                 break
-        yield b""
 
     async def read(self, size: int = None):
         if self._bytes_remaining <= 0:
-            return self._buffer
+            return self._buffered()
 
         if size == 0:
             return b""
 
-        body_length = len(self._buffer)
-        if size is not None and size > 0 and body_length >= size:
-            body = self._buffer[:size]
-            self._buffer = self._buffer[size:]
+        offset = self._offset
+        end = offset + size if size is not None and size > 0 else 0
+        if end and len(self._buffer) >= end:
+            body = self._buffer[offset:end]
+            self._offset = end
+            if end > len(self._buffer) // 2:
+                # Drop the data read already, once it's most of the buffer.
+                self._buffered()
             return body
 
-        async for chunk in self:
-            if not self._is_initial_buffer:
-                self._buffer += chunk
-            if size is not None and size > 0 and len(self._buffer) >= size:
+        # Concatenating `bytes` copies everything received so far for every chunk,
+        # so the chunks are collected into a `bytearray` and converted once.
+        buffer = bytearray(self._buffered())
+        chunks = self.__aiter__()
+        # The buffered data comes first, it has been copied already.
+        await chunks.__anext__()
+        async for chunk in chunks:
+            buffer += chunk
+            if size is not None and size > 0 and len(buffer) >= size:
                 break
 
         if size is not None and size > 0:
-            body = self._buffer[:size]
-            self._buffer = self._buffer[size:]
+            view = memoryview(buffer)
+            body = bytes(view[:size])
+            self._buffer = bytes(view[size:])
+            view.release()
         else:
-            body = self._buffer
+            body = bytes(buffer)
             self._buffer = b""
 
         return body
+
+    async def read_all(self) -> Union[bytes, bytearray]:
+        """
+        Read the rest of the request body, for consumers accepting any bytes-like object (e.g. the `msgspec` decoders).
+
+        The buffer is allocated up front from the content length and the chunks are copied into it,
+        so the body isn't copied again to convert it to `bytes`.
+        """
+        if self._bytes_remaining <= 0:
+            return self._buffered()
+
+        self._buffered()
+        initial_length = len(self._buffer)
+        size = min(initial_length + self._bytes_remaining, _PREALLOCATE_LIMIT)
+        buffer = bytearray(max(size, initial_length))
+        buffer[:initial_length] = self._buffer
+        offset = initial_length
+        chunks = self.__aiter__()
+        # The buffered data comes first, it has been copied already.
+        await chunks.__anext__()
+        async for chunk in chunks:
+            end = offset + len(chunk)
+            buffer[offset:end] = chunk
+            offset = end
+
+        del buffer[offset:]
+        self._buffer = b""
+        return buffer
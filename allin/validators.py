@@ -1,5 +1,5 @@
 from enum import Enum, EnumMeta
-from typing import Any, Union, _AnnotatedAlias
+from typing import Any, Callable, Union, _AnnotatedAlias
 from uuid import UUID
 
 from msgspec import DecodeError, inspect, json
@@ -26,7 +26,22 @@ CONVERTER_FUNCS = {
 }
 
 
+# The result of `_is_requires_double_quotes` for the common types, without `msgspec.inspect`.
+_REQUIRES_DOUBLE_QUOTES = {int: False, float: False, bool: True, str: True, UUID: True}
+
+
 def _is_requires_double_quotes(t: Any):
+    try:
+        requires_double_quotes = _REQUIRES_DOUBLE_QUOTES.get(t)
+    except TypeError:
+        # e.g. `Annotated` with unhashable metadata
+        requires_double_quotes = None
+    if requires_double_quotes is not None:
+        return requires_double_quotes
+    if type(t) is EnumMeta:
+        # msgspec inspects every enum as an `EnumType`, whatever its member type is.
+        return True
+
     ti = inspect.type_info(t, protocol="json")
     if isinstance(ti, (inspect.IntType, inspect.FloatType)):
         return False
@@ -53,18 +68,42 @@ class Validator:
 
             self._before_validate_fn = CONVERTER_FUNCS.get(enum_type)
 
-    def validate(self, value: Any) -> tuple[bool, str]:
-        err = False
-        try:
-            if callable(self._before_validate_fn):
-                value = self._before_validate_fn(value)
+        self._convert = self._build_convert()
+
+    def _build_convert(self) -> Callable[[Any], Any]:
+        """
+        Specialize the conversion for the parameter type once, so `validate` doesn't branch on it for every value.
+        """
+        before_validate_fn = self._before_validate_fn
+        if self.use_msgspec:
+            decode = self.decoder.decode
+            if self.requires_double_quotes:
+
+                def convert(value: Any) -> Any:
+                    return decode(f'"{value}"')
 
-            if self.use_msgspec:
-                value = f'"{value}"' if self.requires_double_quotes else f"{value}"
-                rv = self.decoder.decode(value)
             else:
-                rv = self.decoder(value)
+
+                def convert(value: Any) -> Any:
+                    return decode(f"{value}")
+
+        else:
+            convert = self.decoder
+
+        if not callable(before_validate_fn):
+            return convert
+
+        def convert_before(value: Any) -> Any:
+            return convert(before_validate_fn(value))
+
+        return convert_before
+
+    def validate(self, value: Any) -> tuple[bool, Any]:
+        """
+        Return `(False, converted value)`, or `(True, exception)` if the value is invalid.
+        The exception is not formatted here, as the error may be discarded by the caller (e.g. `Union` types).
+        """
+        try:
+            return False, self._convert(value)
         except (ValueError, DecodeError) as e:
-            rv = str(e)
-            err = True
-        return err, rv
+            return True, e
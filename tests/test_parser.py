@@ -0,0 +1,148 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from allin.errors import HTTPError
+from allin.params import BodyPart, UploadFile
+from allin.parser import FormDataParser
+from allin.stream import BodyStream
+
+BOUNDARY = "XyZ123"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def _part(headers: bytes, data: bytes) -> bytes:
+    return b"--" + BOUNDARY.encode() + b"\r\n" + headers + b"\r\n" + data + b"\r\n"
+
+
+def _field(name: str, data: bytes) -> bytes:
+    return _part(f'Content-Disposition: form-data; name="{name}"\r\n'.encode(), data)
+
+
+def _file(name: str, filename: str, data: bytes) -> bytes:
+    headers = (
+        f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+        "Content-Type: text/plain\r\n"
+    )
+    return _part(headers.encode(), data)
+
+
+def _body(*parts: bytes) -> bytes:
+    return b"".join(parts) + b"--" + BOUNDARY.encode() + b"--\r\n"
+
+
+def _stream(body: bytes, split: Optional[int] = None) -> BodyStream:
+    if split is None:
+        return BodyStream.from_complete(body)
+
+    chunks = [body[i : i + split] for i in range(0, len(body), split)]
+    messages = iter(
+        {"type": "http.request", "body": chunk, "more_body": idx < len(chunks) - 1}
+        for idx, chunk in enumerate(chunks)
+    )
+
+    async def receive():
+        return next(messages)
+
+    return BodyStream(receive, b"", len(body))
+
+
+async def _parse_items(
+    body: bytes,
+    content_type: str = CONTENT_TYPE,
+    split: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> list:
+    parser = FormDataParser(content_type)
+    if chunk_size is not None:
+        parser.chunk_size = chunk_size
+    items = []
+    for name, value in await parser.parse(_stream(body, split)):
+        if isinstance(value, UploadFile):
+            items.append((name, value.filename, value.content_type, await value.read()))
+        else:
+            items.append((name, value.data))
+    return items
+
+
+def _parse(body: bytes, **kwargs) -> list:
+    return asyncio.run(_parse_items(body, **kwargs))
+
+
+def test_fields_and_files():
+    body = _body(_field("a", b"1"), _file("f", "x.txt", b"hello\r\nworld"))
+    assert _parse(body) == [("a", "1"), ("f", "x.txt", "text/plain", b"hello\r\nworld")]
+
+
+@pytest.mark.parametrize("split", [1, 2, 7, 16])
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_boundary_split_across_chunks(split, chunk_size):
+    data = b"--" + BOUNDARY.encode()[:-1] + b"\r\n--\r\n-"
+    body = _body(_field("a", data), _file("f", "x.txt", data), _field("b", b""))
+    expected = [("a", data.decode()), ("f", "x.txt", "text/plain", data), ("b", "")]
+    assert _parse(body, split=split, chunk_size=chunk_size) == expected
+
+
+def test_repeated_fields():
+    body = _body(_field("a", b"1"), _field("a", b"2"), _field("b", b"3"))
+    assert _parse(body) == [("a", "1"), ("a", "2"), ("b", "3")]
+
+
+def test_part_headers():
+    body = _body(_field("a", b"1"))
+
+    async def parse():
+        parser = FormDataParser(CONTENT_TYPE)
+        return await parser.parse(_stream(body))
+
+    [(name, part)] = asyncio.run(parse())
+    assert name == "a"
+    assert isinstance(part, BodyPart)
+    assert part.headers == {"content-disposition": 'form-data; name="a"'}
+
+
+def test_file_spool_rollover():
+    data = bytes(range(256)) * 100  # bigger than the in-memory size of `UploadFile`
+
+    async def parse():
+        parser = FormDataParser(CONTENT_TYPE)
+        parser.chunk_size = 1024
+        items = await parser.parse(_stream(_body(_file("f", "x.bin", data)), 1000))
+        [(_, upload)] = items
+        return upload.fp._file._rolled, await upload.read()
+
+    assert asyncio.run(parse()) == (True, data)
+
+
+def test_preamble_and_epilogue():
+    body = (
+        b"preamble\r\n" + _body(_field("a", b"1")) + b"epilogue --" + BOUNDARY.encode()
+    )
+    assert _parse(body) == [("a", "1")]
+    assert _parse(body, split=3, chunk_size=1) == [("a", "1")]
+
+
+def test_missing_boundary():
+    with pytest.raises(HTTPError) as exc_info:
+        FormDataParser("multipart/form-data")
+    assert exc_info.value.code == 415
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        # Missing 'name'
+        _body(_part(b"Content-Disposition: form-data\r\n", b"1")),
+        # Missing 'content-disposition'
+        _body(_part(b"Content-Type: text/plain\r\n", b"1")),
+        # Header line without ':'
+        _body(_part(b'Content-Disposition: form-data; name="a"\r\nbroken\r\n', b"1")),
+        # Neither CRLF nor '--' after the boundary
+        b"--" + BOUNDARY.encode() + b"xx",
+    ],
+)
+def test_invalid_body(body):
+    with pytest.raises(HTTPError) as exc_info:
+        _parse(body)
+    assert exc_info.value.code == 415
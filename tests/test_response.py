@@ -0,0 +1,89 @@
+import asyncio
+
+from allin.response import CoalescingSender, StreamingResponse
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _send(response: StreamingResponse) -> list:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response(send))
+    return messages
+
+
+def _bodies(messages: list) -> list:
+    return [(m["body"], m["more_body"]) for m in messages[1:]]
+
+
+def test_streaming_response():
+    messages = _send(StreamingResponse(_chunks(b"a", b"b", b"c")))
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 200
+    assert _bodies(messages) == [(b"a", True), (b"b", True), (b"c", True), (b"", False)]
+
+
+def test_streaming_response_has_no_content_length():
+    response = StreamingResponse(_chunks(b"a"))
+    assert dict(response.raw_headers) == {b"content-type": b"text/plain; charset=utf-8"}
+
+
+def test_streaming_response_encodes_str_chunks():
+    response = StreamingResponse(_chunks("é", b"\xff"))
+    response.charset = "latin-1"
+    assert _bodies(_send(response)) == [(b"\xe9", True), (b"\xff", True), (b"", False)]
+
+
+def test_streaming_response_coalesce():
+    messages = _send(StreamingResponse(_chunks(b"a", "b", b"c"), coalesce=True))
+    assert messages[0]["type"] == "http.response.start"
+    # The buffered chunks are sent with the final message.
+    assert _bodies(messages) == [(b"abc", False)]
+
+
+def test_coalescing_sender_flushes_at_max_size():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        sender = CoalescingSender(send)
+        chunk = b"x" * 1024
+        for _ in range(64 + 3):
+            await sender(
+                {"type": "http.response.body", "body": chunk, "more_body": True}
+            )
+        await sender({"type": "http.response.body", "body": b"end", "more_body": False})
+
+    asyncio.run(run())
+    assert [(len(m["body"]), m["more_body"]) for m in messages] == [
+        (64 * 1024, True),
+        (3 * 1024 + 3, False),
+    ]
+
+
+def test_coalescing_sender_flushes_before_other_messages():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        sender = CoalescingSender(send, max_size=10)
+        await sender({"type": "http.response.body", "body": b"ab", "more_body": True})
+        await sender({"type": "http.response.trailers"})
+        await sender({"type": "http.response.body", "body": b"", "more_body": False})
+
+    asyncio.run(run())
+    assert messages == [
+        {"type": "http.response.body", "body": b"ab", "more_body": True},
+        {"type": "http.response.trailers"},
+        {"type": "http.response.body", "body": b"", "more_body": False},
+    ]
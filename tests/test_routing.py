@@ -0,0 +1,44 @@
+import pytest
+
+from allin.errors import EndpointError
+from allin.routing import MatchingCode, Router
+
+
+async def _handler(id: int):  # noqa: A002
+    pass
+
+
+async def _static_handler():
+    pass
+
+
+def test_add_methods_to_sub_router_endpoint_clears_its_lookup_cache():
+    api = Router(prefix="/api")
+    api.add_endpoint("/items/{id}", _handler, methods=["get"])
+    root = Router()
+    root.include_router(api)
+    assert root.find("/api/items/3", "POST")[0] == MatchingCode.UNSUPPORTED_METHODS
+
+    root.add_endpoint("/api/items/{id}", _handler, methods=["post"])
+    assert root.find("/api/items/3", "POST")[0] == MatchingCode.FOUND
+    assert root.find("/api/items/4", "POST")[0] == MatchingCode.FOUND
+
+
+def test_add_methods_to_sub_router_static_endpoint():
+    api = Router(prefix="/api")
+    api.add_endpoint("/items", _static_handler, methods=["get"])
+    root = Router()
+    root.include_router(api)
+    assert root.find("/api/items", "POST")[0] == MatchingCode.UNSUPPORTED_METHODS
+
+    root.add_endpoint("/api/items", _static_handler, methods=["post"])
+    matching_code, endpoint, _ = root.find("/api/items", "POST")
+    assert matching_code == MatchingCode.FOUND
+    assert endpoint.func is _static_handler
+
+
+def test_unknown_method():
+    router = Router()
+    with pytest.raises(EndpointError):
+        router.add_endpoint("/items", _static_handler, methods=["get", "fetch"])
+    assert router.find("/items", "GET")[0] == MatchingCode.NOT_FOUND
@@ -0,0 +1,53 @@
+import asyncio
+
+from allin.stream import BodyStream
+
+
+def _stream(initial_buffer: bytes, *chunks: bytes) -> BodyStream:
+    messages = iter(
+        {"type": "http.request", "body": chunk, "more_body": idx < len(chunks) - 1}
+        for idx, chunk in enumerate(chunks)
+    )
+
+    async def receive():
+        return next(messages)
+
+    content_length = len(initial_buffer) + sum(map(len, chunks))
+    return BodyStream(receive, initial_buffer, content_length)
+
+
+async def _read_then_read_all(stream: BodyStream, size: int) -> tuple[bytes, bytes]:
+    head = await stream.read(size)
+    rest = await stream.read_all()
+    return head, bytes(rest)
+
+
+def test_read_all():
+    stream = _stream(b"abc", b"def", b"gh")
+    assert bytes(asyncio.run(stream.read_all())) == b"abcdefgh"
+
+
+def test_read_then_read_all_from_initial_buffer():
+    stream = _stream(b"abcdef", b"gh")
+    assert asyncio.run(_read_then_read_all(stream, 3)) == (b"abc", b"defgh")
+
+
+def test_read_then_read_all_after_receiving():
+    stream = _stream(b"abc", b"defg", b"h")
+    assert asyncio.run(_read_then_read_all(stream, 5)) == (b"abcde", b"fgh")
+
+
+async def _read_twice(stream: BodyStream, size: int, next_size: int = None):
+    first = await stream.read(size)
+    second = await stream.read(next_size)
+    return first, second
+
+
+def test_read_then_read_after_receiving():
+    stream = _stream(b"abc", b"defg", b"h")
+    assert asyncio.run(_read_twice(stream, 5, 3)) == (b"abcde", b"fgh")
+
+
+def test_read_then_read_rest_after_receiving():
+    stream = _stream(b"abc", b"defg", b"hij")
+    assert asyncio.run(_read_twice(stream, 5)) == (b"abcde", b"fghij")